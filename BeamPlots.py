@@ -100,7 +100,7 @@ sky_pixels = hp.query_disc(nside,sky_center,sky_fov)
 u,v,_ = hp.pix2vec(nside,sky_pixels)
 
 # Define scanning space
-scan_pixels = np.atleast_1d(hp.ang2pix(nside,theta0,phi0))
+scan_pixels = hp.ang2pix(nside,[theta0],[phi0])
 
 # Get matrix of steered beams
 A_matrix = np.abs(af.array_factor_hpmatrix(nside,sky_pixels,scan_pixels,p1))**2
@@ -118,8 +118,8 @@ plt.colorbar(im,ax=ax)
 plt.savefig('./Outputs/AsteeredHP.png')
 
 # With real elements
-filename = './HealpixPatterns/Farfield120_5GHz.txt'
-E = np.loadtxt(filename)
+filename = './HealpixPatterns/Farfield120_5GHz.npy'
+E = np.load(filename)
 E = E[sky_pixels]
 A_elem = (E**2)*A_matrix[0,:]
 
@@ -35,8 +35,8 @@ fig.colorbar(im,ax=ax)
 plt.savefig('./Outputs/clean_uv.png')
 
 #%% Get element pattern
-filename = './HealpixPatterns/Farfield120_5GHz.txt'
-E = np.loadtxt(filename)
+filename = './HealpixPatterns/Farfield120_5GHz.npy'
+E = np.load(filename)
 E = E[sky_pixels]
 apparent_sky = E*clean_img[sky_pixels]
 
@@ -56,11 +56,8 @@ scan_fov = np.radians()
 scan_pixels = hp.query_disc(nside,sky_center,scan_fov)
 u0,v0,_ = hp.pix2vec(nside,scan_pixels)
 
-#%% Imaging (slow)
-dirty_img = np.zeros(len(scan_pixels))
-for idx,pix in enumerate(scan_pixels):
-    A = np.abs(af.array_factor_hp(nside,sky_pixels,np.atleast_1d(pix),p))**2
-    dirty_img[np.atleast_1d(idx)] = A@apparent_sky
+#%% Imaging
+dirty_img = af.dirty_image(l,m,u0,v0,p,apparent_sky)
 
 # Plot dirty image
 fig = plt.figure(figsize=(8,6))
@@ -22,9 +22,8 @@ def upa_positions(Nx:int,Ny: int,dx:float=0.5,dy:float=0.5) -> np.ndarray:
         (Nx*Ny,2) matrix of element positions.
     """
     
-    px = np.tile(np.arange(Nx),Ny)*dx
-    py = np.repeat(np.arange(Ny),Nx)*dy
-    p = np.stack((px,py),1)
+    iy,ix = np.indices((Ny,Nx))
+    p = np.column_stack((ix.ravel()*dx,iy.ravel()*dy))
     return p
 
 
@@ -83,8 +82,52 @@ def array_manifold(l:np.ndarray,m:np.ndarray,positions:np.ndarray) -> np.ndarray
     Notes
     -----
     The direction cosines l and m should be obtained by flattening 2D meshgrids.
+    The manifold is computed in single precision (complex64), which is 
+    sufficient for far-field patterns and halves the memory traffic.
     """
-    return np.exp(2j*np.pi*positions@(np.stack((l,m))))
+    positions = positions.astype(np.float32,copy=False)
+    S = np.stack((l,m)).astype(np.float32,copy=False)
+    return np.exp(2j*np.pi*(positions@S))
+
+
+def array_factor_lmmatrix(l:np.ndarray,m:np.ndarray,l0:np.ndarray,m0:np.ndarray,positions:np.ndarray) -> np.ndarray:
+    """
+    Compute the array factor steered in specific direction(s),
+    for directions given by their direction cosines.
+
+    Parameters
+    ----------
+    l: array_like
+        direction cosines of the source directions.
+    m: array_like
+        direction cosines of the source directions.
+    l0: array_like
+        direction cosines of the steering directions.
+    m0: array_like
+        direction cosines of the steering directions.
+    positions: array_like
+        (J,2) matrix of normalized element positions.
+
+    Returns 
+    -------
+    A: array_like 
+        (len(l0),len(l)) matrix of complex steered array factors.
+
+    Notes
+    -----
+    Use this instead of array_factor_hpmatrix when the direction cosines
+    are already available, e.g. when steering in blocks of directions
+    over the same sources, to avoid converting pixels at each call.
+    """
+
+    E = array_manifold(l,m,positions)
+    E0 = array_manifold(l0,m0,positions)
+
+    # The sum over the elements is the product of the conjugate steering
+    # manifold with the source manifold
+    A = E0.conj().T@E
+    
+    return A
 
 
 def array_factor_hpmatrix(nside:int,source_pixels:np.ndarray,scan_pixels:np.ndarray,positions:np.ndarray) -> np.ndarray:
@@ -99,7 +142,7 @@ def array_factor_hpmatrix(nside:int,source_pixels:np.ndarray,scan_pixels:np.ndar
     source_pixels: array_like
         indices for the healpix pixels corresponding to source directions.
     scan_pixels: array_like
-        indices for the healpix pixels corresponding to steering directions.
+        1D array of indices for the healpix pixels corresponding to steering directions.
     positions: array_like
         (J,2) matrix of normalized element positions.
 
@@ -112,27 +155,102 @@ def array_factor_hpmatrix(nside:int,source_pixels:np.ndarray,scan_pixels:np.ndar
     -----
     This implementation computes the steered array factor for all 
     steering directions in one matrix computation. Each row in the output
-    array is a healpix map for a different steering direction.
+    array is a healpix map for a different steering direction. Prefer it 
+    over calling array_factor_hp in a loop.
     """
     
     sx,sy,_ = hp.pix2vec(nside,source_pixels)
-    S = np.stack((sx,sy))
-    s0x,s0y,_ = hp.pix2vec(nside,np.atleast_1d(scan_pixels))
-    S0 = np.stack((s0x,s0y))
-
-    nsource = len(source_pixels)
-    nscan = len(scan_pixels)
-    # Repeat the source matrix for each steering angle
-    S = np.tile(S,(1,nscan))
-    # Repeat each steering direction to match the dimension of the source matrix
-    S0 = np.repeat(S0,nsource,axis=1)
-
-    A = np.sum(np.exp(2j*np.pi*positions@(S-S0)),0)
-    A = A.reshape((nscan,nsource))
+    s0x,s0y,_ = hp.pix2vec(nside,scan_pixels)
+    A = array_factor_lmmatrix(sx,sy,s0x,s0y,positions)
     
     return A
 
 
+def imaging_matrix(source_manifold:np.ndarray,scan_manifold:np.ndarray) -> np.ndarray:
+    """
+    Compute the power beam matrix mapping a sky brightness distribution
+    to a dirty image.
+
+    Parameters
+    ----------
+    source_manifold: array_like
+        (J,P) array manifold of the sky pixels.
+    scan_manifold: array_like
+        (J,Nscan) array manifold of the scan directions.
+
+    Returns 
+    -------
+    P: array_like 
+        (Nscan,P) real matrix of steered power beams.
+
+    Notes
+    -----
+    The manifolds should be obtained with array_manifold. The source 
+    manifold does not depend on the scan directions, so it can be computed
+    once and reused when the scan directions are processed in blocks.
+
+    The dirty image of an apparent sky x is P@x. The matrix only depends
+    on the array and on the sky and scan directions, so it can be reused
+    for many sky realizations, stacked as the columns of a matrix.
+    P is single precision: cast x to P.dtype before the product, otherwise
+    numpy makes a double precision copy of P.
+    """
+
+    A = scan_manifold.conj().T@source_manifold
+    P = A.real**2+A.imag**2
+
+    return P
+
+
+def dirty_image(l:np.ndarray,m:np.ndarray,l0:np.ndarray,m0:np.ndarray,positions:np.ndarray,apparent_sky:np.ndarray,block:int=256) -> np.ndarray:
+    """
+    Compute the dirty image of an apparent sky scanned by the array.
+
+    Parameters
+    ----------
+    l: array_like
+        direction cosines of the sky pixels.
+    m: array_like
+        direction cosines of the sky pixels.
+    l0: array_like
+        direction cosines of the scan directions.
+    m0: array_like
+        direction cosines of the scan directions.
+    positions: array_like
+        (J,2) matrix of normalized element positions.
+    apparent_sky: array_like
+        (len(l),) apparent sky brightness, or (len(l),K) matrix of 
+        K apparent skies.
+    block: int
+        number of scan directions processed at once.
+
+    Returns 
+    -------
+    img: array_like 
+        (len(l0),) dirty image, or (len(l0),K) matrix of dirty images.
+
+    Notes
+    -----
+    The (J,len(l)) sky manifold is computed once, and the imaging matrix 
+    is built in blocks of scan directions, so that besides the manifold
+    only a (block,len(l)) matrix is held in memory at a time. Each block
+    is applied to all the apparent skies with a single matrix product.
+    """
+
+    source_manifold = array_manifold(l,m,positions)
+    # Match the single precision imaging matrix, so that each block is
+    # applied with SGEMV/SGEMM instead of being upcast to double
+    apparent_sky = np.asarray(apparent_sky,dtype=np.float32)
+    img = np.zeros((len(l0),)+apparent_sky.shape[1:])
+    for start in range(0,len(l0),block):
+        stop = start+block
+        scan_manifold = array_manifold(l0[start:stop],m0[start:stop],positions)
+        P = imaging_matrix(source_manifold,scan_manifold)
+        img[start:stop] = P@apparent_sky
+
+    return img
+
+
 def array_factor_hp(nside:int,source_pixels:np.ndarray,scan_pixel:np.ndarray,positions:np.ndarray) -> np.ndarray:
     """
     Compute the array factor steered in a specific direction,
@@ -158,15 +276,15 @@ def array_factor_hp(nside:int,source_pixels:np.ndarray,scan_pixel:np.ndarray,pos
     Notes
     -----
     This implementation computes the steered array factor for one
-    steering direction. Call this in a loop for multiple directions.
+    steering direction. Use array_factor_hpmatrix for multiple directions.
     """
     
     sx,sy,_ = hp.pix2vec(nside,source_pixels)
-    S = np.stack((sx,sy))
     s0x,s0y,_ = hp.pix2vec(nside,np.atleast_1d(scan_pixel))
-    S0 = np.stack((s0x,s0y))
+    E = array_manifold(sx,sy,positions)
+    E0 = array_manifold(s0x,s0y,positions)
 
-    a = np.sum(np.exp(2j*np.pi*positions@(S-S0)),0)
+    a = E0[:,0].conj()@E
     
     return a
 
@@ -200,10 +318,12 @@ def array_factor_tp(theta:np.ndarray,phi:np.ndarray,theta0:float,phi0:float,posi
     The angles theta and phi should be obtained by flattening 2D meshgrids.
     """
 
-    S = hp.ang2vec(theta,phi)[:,:2].T
-    S0 = hp.ang2vec(np.atleast_1d(theta0),np.atleast_1d(phi0))[:,:2].T
+    st = np.sin(theta)
+    st0 = np.sin(theta0)
+    E = array_manifold(st*np.cos(phi),st*np.sin(phi),positions)
+    E0 = array_manifold(np.atleast_1d(st0*np.cos(phi0)),np.atleast_1d(st0*np.sin(phi0)),positions)
 
-    a = np.sum(np.exp(2j*np.pi*positions@(S-S0)),0)
+    a = E0[:,0].conj()@E
     
     return a
 
@@ -237,10 +357,10 @@ def array_factor_lm(l:np.ndarray,m:np.ndarray,l0:float,m0:float,positions:np.nda
     The direction cosines l and m should be obtained by flattening 2D meshgrids.
     """
 
-    S = np.stack((l,m))
-    S0 = np.stack((np.atleast_1d(l0),np.atleast_1d(m0)))
+    E = array_manifold(l,m,positions)
+    E0 = array_manifold(np.atleast_1d(l0),np.atleast_1d(m0),positions)
 
-    a = np.sum(np.exp(2j*np.pi*positions@(S-S0)),0)
+    a = E0[:,0].conj()@E
     
     return a
 
@@ -265,12 +385,10 @@ def linear_directivity(a:np.ndarray,d:float) -> float:
 
     N = len(a)
     D_num = np.sum(np.abs(a))**2
-    coeff_products = np.kron(a,a).reshape((N,N))
+    coeff_products = np.outer(a,a)
 
-    diff_matrix = np.zeros((N,N))
-    for i in range(1,N):
-        diag = np.ones(N-i)*i
-        diff_matrix = diff_matrix + np.diag(-diag,i) + np.diag(diag,-i)
+    idx = np.arange(N)
+    diff_matrix = idx[:,None]-idx[None,:]
     
     sinc_args = 2*d*diff_matrix
     D_den = np.sum(coeff_products*np.sinc(sinc_args))
@@ -302,7 +420,7 @@ def radiated_power(PowerPattern:np.ndarray,theta:np.ndarray,phi:np.ndarray) -> f
     dt = theta[1]-theta[0]
     dp = phi[1]-phi[0]
 
-    return np.sum(np.sum(PowerPattern*np.sin(theta),1)*dt,0)*dp
+    return np.einsum('pt,t->',PowerPattern,np.sin(theta))*dt*dp
 
 
 def numerical_directivity(PowerPattern:np.ndarray,theta:np.ndarray,phi:np.ndarray) -> float:
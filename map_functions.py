@@ -1,5 +1,6 @@
 import numpy as np
 import healpy as hp
+from concurrent.futures import ProcessPoolExecutor
 
 def CSTmap2healpix(in_filename:str,nside_out:int) -> np.ndarray:
     """   
@@ -21,28 +22,36 @@ def CSTmap2healpix(in_filename:str,nside_out:int) -> np.ndarray:
     -----
     The minimum healpix map resolution is first computed, and 
     available data is written on the map. The values for empty pixels are 
-    computed by averaging the values of their neighbors.
+    computed by averaging the values of their neighbors, repeating until 
+    every pixel has a value.
     """
     
-    table = np.loadtxt(in_filename,skiprows=2)
+    table = np.loadtxt(in_filename,skiprows=2,usecols=(0,1,2))
     theta = np.radians(table[:,0])
     phi = np.radians(table[:,1])
     Eabs = table[:,2]
 
     nside = hp.pixelfunc.get_min_valid_nside(len(Eabs))
     npix = hp.nside2npix(nside)
-    healpix_map = np.ones(npix)*np.inf
+    healpix_map = np.full(npix,np.nan)
     pixels = hp.ang2pix(nside,theta,phi)
 
     healpix_map[pixels] = Eabs
-    for i in range(0,npix):
-        if i not in pixels:
-            z_interp = 0
-            neighbors = hp.get_all_neighbours(nside,i)
-            values = healpix_map[neighbors]
-            idx = np.where(np.isfinite(values))
-            z_interp = np.sum(values[idx[0]])/len(idx[0])
-            healpix_map[i] = z_interp
+    missing = np.flatnonzero(np.isnan(healpix_map))
+
+    # Empty pixels surrounded by empty pixels are filled in later passes,
+    # once some of their neighbors have been filled
+    while missing.size:
+        # (8,len(missing)) matrix of neighbor values for all empty pixels
+        values = healpix_map[hp.get_all_neighbours(nside,missing)]
+        fillable = ~np.all(np.isnan(values),0)
+        if not np.any(fillable):
+            break
+        healpix_map[missing[fillable]] = np.nanmean(values[:,fillable],0)
+        missing = missing[~fillable]
+
+    if np.any(np.isnan(healpix_map)):
+        raise ValueError(f'{in_filename}: could not fill all empty healpix pixels.')
     healpix_map = hp.ud_grade(healpix_map,nside_out)
 
     return healpix_map
@@ -70,21 +79,27 @@ def import_pattern(filename:str,delta:float) -> np.ndarray:
         azimuth angles in radians where the radiated field is evaluated.
     """
 
-    table = np.loadtxt(filename,skiprows=2)
+    Eabs = np.loadtxt(filename,skiprows=2,usecols=2)
 
     theta = np.radians(np.arange(0,180+delta,delta))
     phi = np.radians(np.arange(0,360,delta))
     nphi = len(phi)
 
-    Eabs = table[:,2].reshape((nphi,-1))
+    Eabs = Eabs.reshape((nphi,-1))
     
     return Eabs, theta, phi
 
 
+def _convert_pattern(task:tuple) -> None:
+    bw,f = task
+    in_name = f'./ElementPatterns/Farfield{bw}_{f}GHz.txt'
+    healpix_map = CSTmap2healpix(in_name,64)
+    out_name = f'./HealpixPatterns/Farfield{bw}_{f}GHz.npy'
+    np.save(out_name,healpix_map.astype(np.float32))
+
+
 if __name__=='__main__':
-    for bw in [60,90,120]:
-        for f in [4,5,6]:
-            in_name = f'./ElementPatterns/Farfield{bw}_{f}GHz.txt'
-            healpix_map = CSTmap2healpix(in_name,64)
-            out_name = f'./HealpixPatterns/Farfield{bw}_{f}GHz.txt'
-            np.savetxt(out_name,healpix_map)
+    # Each pattern is converted independently, one per process
+    tasks = [(bw,f) for bw in [60,90,120] for f in [4,5,6]]
+    with ProcessPoolExecutor() as executor:
+        list(executor.map(_convert_pattern,tasks))